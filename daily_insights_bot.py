@@ -17,9 +17,28 @@ Deployment
    `09:30 Asia/Tehran` year-round (Tehran is UTC+3:30 and no longer uses DST).
    - **Render**:  Settings ▸ Cron > “0 6 * * *”.
    - **Railway**:  New ▸ Cron Job > schedule "0 6 * * *".
+   Alternatively, halve OpenAI spend with the Batch API by scheduling two
+   cron jobs instead: `0 6 * * *` running `--submit-batch` and `0 8 * * *`
+   running `--collect-batch` (the batch normally completes within minutes;
+   OpenAI guarantees 24 h).
 4. **Add a `requirements.txt`** (see bottom of this file) and enable automatic
    builds.
 
+On your own box, a systemd timer does the same job without keeping a
+Python process resident between runs::
+
+    # /etc/systemd/system/daily-insights.service
+    [Service]
+    Type=oneshot
+    ExecStart=/usr/bin/python3 /opt/insights/daily_insights_bot.py --run-once
+
+    # /etc/systemd/system/daily-insights.timer
+    [Timer]
+    OnCalendar=*-*-* 06:00:00 UTC
+    Persistent=true
+    [Install]
+    WantedBy=timers.target
+
 Local quick test:
 ```
 python daily_insights_bot.py --run-once
@@ -27,17 +46,27 @@ python daily_insights_bot.py --run-once
 """
 from __future__ import annotations
 
+import asyncio
 import os
+import hashlib
 import html
+import io
+import json
 import logging
-import textwrap
+import re
+import socket
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import aiohttp
 import feedparser
+import httpx
 import openai
-import pytz
 import requests
+import tenacity
 
 # Optional but greatly improves full-text extraction; comment out on slim images
 try:
@@ -60,109 +89,486 @@ RSS_FEEDS = [
 MAX_ITEMS = 5     # deliver exactly five insights
 MAX_ARTICLE_AGE_HOURS = 36  # consider items published within last 36 h
 
-# Models – adapt if you have different quota
+# Sources whose RSS <content:encoded> reliably carries the full article body;
+# for these the per-article HTTP GET and newspaper3k parse are skipped
+FULL_TEXT_SOURCES = {"Harvard Business Review", "World Economic Forum"}
+
+# Model – adapt if you have different quota; the fused summarize+translate
+# prompt uses a single model for both languages
 MODEL_SUMMARY = "gpt-4o"
-MODEL_TRANSLATE = "gpt-4o-mini"  # cheaper model for translation
+
+# Cap on article tokens sent to the summarizer; prompt cost would otherwise
+# scale with whatever newspaper3k extracts (tens of thousands of chars)
+MAX_SUMMARY_INPUT_TOKENS = 3000
+
+# Optional exact tokenizer; falls back to a character bound when unavailable
+try:
+    import tiktoken  # type: ignore
+
+    _ENC = tiktoken.encoding_for_model(MODEL_SUMMARY)
+except Exception:  # tiktoken not installed or encoding unavailable offline
+    _ENC = None
 
 # Telegram
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 
-# Logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+# OpenAI Batch API state shared between the submit and collect cron runs
+BATCH_STATE_FILE = "/tmp/insights_batch_state.json"
+
+# Summary/translation cache so retried runs do not re-bill unchanged articles
+CACHE_DB = "insights_cache.sqlite"
+CACHE_TTL_DAYS = 14
+
+# Per-feed ETag/Last-Modified state so unchanged feeds answer 304 with no body
+FEED_STATE_FILE = "feed_state.json"
+
+# Logging: a dedicated handler with propagate=False so every record is
+# formatted exactly once (the root handler would otherwise reformat each one,
+# and %(asctime)s formatting is surprisingly costly)
+log = logging.getLogger("insights")
+log.setLevel(logging.INFO)
+_handler = logging.StreamHandler()
+_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+)
+log.addHandler(_handler)
+log.propagate = False
+
+# One slow feed must not stall the whole fetch pool
+socket.setdefaulttimeout(10)
+
+# Shared OpenAI clients so the SDK reuses one httpx connection pool across
+# calls instead of re-handshaking per request. Created lazily so the module
+# imports cleanly without OPENAI_API_KEY set.
+_OPENAI: Optional[openai.OpenAI] = None
+_OPENAI_ASYNC: Optional[openai.AsyncOpenAI] = None
+_LLM_SEMAPHORE = asyncio.Semaphore(10)
+
+# A hanging OpenAI call must not stall the run past the delivery window:
+# cap connect and total time explicitly, and retry transient failures
+_OPENAI_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_llm_retry = tenacity.retry(
+    stop=tenacity.stop_after_attempt(4),
+    wait=tenacity.wait_exponential(multiplier=1, max=20),
+    retry=tenacity.retry_if_exception_type(
+        (openai.APIConnectionError, openai.RateLimitError)
+    ),
+    reraise=True,
+)
+
+
+def _client() -> openai.OpenAI:
+    global _OPENAI
+    if _OPENAI is None:
+        _OPENAI = openai.OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"), timeout=_OPENAI_TIMEOUT, max_retries=3
+        )
+    return _OPENAI
+
+
+def _async_client() -> openai.AsyncOpenAI:
+    global _OPENAI_ASYNC
+    if _OPENAI_ASYNC is None:
+        _OPENAI_ASYNC = openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"), timeout=_OPENAI_TIMEOUT, max_retries=3
+        )
+    return _OPENAI_ASYNC
+
+
+# Keep the HTTPS connection to api.telegram.org warm across sends/retries,
+# and back off-and-retry transient failures at the transport level
+_TG = requests.Session()
+_TG.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        max_retries=requests.adapters.Retry(total=3, backoff_factor=0.5)
+    ),
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def fetch_recent_entries() -> List[Tuple[str, str, str, datetime]]:
-    """Return list of (title, link, summary_html, published_dt) sorted newest-first."""
+def _load_feed_state() -> Dict[str, Dict[str, str]]:
+    try:
+        with open(FEED_STATE_FILE, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_feed_state(state: Dict[str, Dict[str, str]]) -> None:
+    with open(FEED_STATE_FILE, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+
+
+def _dedupe_entries(
+    entries: List[Tuple[str, str, str, datetime, bool]]
+) -> List[Tuple[str, str, str, datetime, bool]]:
+    """Drop repeats of the same article syndicated across feeds.
+
+    Matches on the canonical link (query string and trailing slash stripped)
+    or an identical lower-cased title; the first (newest) occurrence wins.
+    """
+    seen: set = set()
+    unique: List[Tuple[str, str, str, datetime, bool]] = []
+    for entry in entries:
+        title, link = entry[0], entry[1]
+        canon = re.sub(r"\?.*", "", link.lower().rstrip("/"))
+        title_key = hashlib.md5(title.lower().encode()).hexdigest()
+        if (canon and canon in seen) or title_key in seen:
+            continue
+        if canon:
+            seen.add(canon)
+        seen.add(title_key)
+        unique.append(entry)
+    return unique
+
+
+def fetch_recent_entries() -> List[Tuple[str, str, str, datetime, bool]]:
+    """Return (title, link, summary_html, published_dt, has_full_text) newest-first.
+
+    has_full_text is True when the feed itself shipped the article body
+    (``<content:encoded>``), in which case summary_html holds that body and
+    no per-article download is needed.
+    """
+    # Compare as plain (y, m, d, h, m, s) tuples in the loop: a C tuple
+    # compare per entry instead of two datetime constructions
     cutoff = datetime.utcnow() - timedelta(hours=MAX_ARTICLE_AGE_HOURS)
-    entries: List[Tuple[str, str, str, datetime]] = []
-    for source, url in RSS_FEEDS:
-        d = feedparser.parse(url)
+    cutoff_tuple = tuple(cutoff.timetuple())[:6]
+    feed_state = _load_feed_state()
+
+    def _parse_feed(feed: Tuple[str, str]) -> List[Tuple[str, str, str, datetime, bool]]:
+        source, url = feed
+        results: List[Tuple[str, str, str, datetime, bool]] = []
+        # Conditional GET: unchanged feeds answer 304 and skip the XML body
+        prev = feed_state.get(url, {})
+        d = feedparser.parse(url, etag=prev.get("etag"), modified=prev.get("modified"))
+        status = getattr(d, "status", None)
+        if status == 304:
+            return results
+        if status is not None:
+            # Only a real response may replace the saved validators; a failed
+            # fetch has no status and must not clobber them with None
+            feed_state[url] = {"etag": d.get("etag"), "modified": d.get("modified")}
         for e in d.entries:
-            # Try to parse publication date; skip if unavailable
-            if "published_parsed" not in e:
-                continue
-            published = datetime(*e.published_parsed[:6], tzinfo=timezone.utc)
-            if published < cutoff:
+            # Skip undated or stale entries before building any datetime
+            p = e.get("published_parsed")
+            if not p or tuple(p)[:6] < cutoff_tuple:
                 continue
+            published = datetime(*p[:6], tzinfo=timezone.utc)
             title = e.get("title", "(no title)")
             link = e.get("link", "")
-            summary = e.get("summary", "")
-            entries.append((title, link, summary, published))
-    # Sort by recency
+            # Prefer the feed-shipped article body for known full-text feeds
+            content = ""
+            if source in FULL_TEXT_SOURCES and e.get("content"):
+                content = e.content[0].value or ""
+            summary = content or e.get("summary", "")
+            results.append((title, link, summary, published, bool(content)))
+        return results
+
+    # Feed fetching is IO-bound, so fan out one thread per feed
+    entries: List[Tuple[str, str, str, datetime, bool]] = []
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as ex:
+        for result in ex.map(_parse_feed, RSS_FEEDS):
+            entries.extend(result)
+    _save_feed_state(feed_state)
+    # Sort by recency, then drop cross-feed duplicates before the cutoff
     entries.sort(key=lambda x: x[3], reverse=True)
+    entries = _dedupe_entries(entries)
     return entries[: MAX_ITEMS * 2]  # take extra in case some fail later
 
 
-def extract_text(url: str, fallback_html: str) -> str:
-    """Return clean article text either via newspaper3k or by stripping HTML."""
-    if Article:
-        try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            if article.text:
-                return article.text
-        except Exception as exc:  # pragma: no cover
-            logging.warning("newspaper3k failed: %s", exc)
-    # Fallback: strip tags from feed summary
-    return html.unescape(
-        textwrap.shorten(
-            " ".join(html.unescape(fallback_html).split()), width=2000, placeholder="…"
-        )
-    )
-
-
-def chat_completion(model: str, system: str, user: str) -> str:
+async def _fetch_html(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """Download one article's HTML; return None on any failure/timeout."""
+    try:
+        async with asyncio.timeout(8):
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                return await resp.text()
+    except Exception as exc:
+        log.warning("Download failed for %s: %s", url, exc)
+        return None
+
+
+def download_articles(urls: List[str]) -> Dict[str, Optional[str]]:
+    """Fetch all article pages concurrently; map url -> HTML (or None)."""
+
+    async def _gather() -> List[Optional[str]]:
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(
+                *[_fetch_html(session, url) for url in urls], return_exceptions=False
+            )
+
+    return dict(zip(urls, asyncio.run(_gather())))
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def _strip_html(raw: str, limit: int = 2000) -> str:
+    """Strip tags and collapse whitespace with two linear regex passes."""
+    text = _WS_RE.sub(" ", _TAG_RE.sub(" ", raw)).strip()
+    text = html.unescape(text)
+    return text[:limit] + ("…" if len(text) > limit else "")
+
+
+def _parse_html(url_html: Tuple[str, str]) -> str:
+    """Parse pre-downloaded HTML with newspaper3k; picklable for worker processes."""
+    url, html_doc = url_html
+    try:
+        article = Article(url)
+        # HTML was already fetched concurrently; parse() is CPU-only
+        article.download(input_html=html_doc)
+        article.parse()
+        return article.text or ""
+    except Exception as exc:  # pragma: no cover
+        log.warning("newspaper3k failed: %s", exc)
+        return ""
+
+
+def extract_text(fallback_html: str, has_full_text: bool = False) -> str:
+    """Return clean article text by stripping the feed-shipped HTML.
+
+    newspaper3k extraction happens in _parse_html via the process pool; this
+    covers the entries it could not, from either a full article body or a
+    teaser summary.
+    """
+    if has_full_text:
+        # The feed already shipped the article body; no download or lxml parse.
+        # The cap is generous here since this is real article text, not a teaser
+        return _strip_html(fallback_html, limit=MAX_SUMMARY_INPUT_TOKENS * 4)
+    return _strip_html(fallback_html)
+
+
+@_llm_retry
+def chat_completion(
+    model: str,
+    system: str,
+    user: str,
+    max_tokens: int = 300,
+    json_response: bool = False,
+) -> str:
     """Wrapper to call OpenAI with sensible defaults."""
-    openai.api_key = os.getenv("OPENAI_API_KEY")
-    resp = openai.chat.completions.create(
+    kwargs = {"response_format": {"type": "json_object"}} if json_response else {}
+    resp = _client().chat.completions.create(
         model=model,
         temperature=0.3,
-        max_tokens=300,
+        max_tokens=max_tokens,
         messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+        **kwargs,
     )
     return resp.choices[0].message.content.strip()
 
 
-def summarize(article_text: str) -> str:
-    system = "You are a strategy editor writing concise executive summaries."
-    user = (
+@_llm_retry
+async def chat_completion_async(
+    model: str,
+    system: str,
+    user: str,
+    max_tokens: int = 300,
+    json_response: bool = False,
+) -> str:
+    """Async variant of chat_completion for fanning out independent calls."""
+    kwargs = {"response_format": {"type": "json_object"}} if json_response else {}
+    async with _LLM_SEMAPHORE:
+        resp = await _async_client().chat.completions.create(
+            model=model,
+            temperature=0.3,
+            max_tokens=max_tokens,
+            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+            **kwargs,
+        )
+    return resp.choices[0].message.content.strip()
+
+
+INSIGHT_SYSTEM = (
+    "You are a strategy editor writing concise executive summaries and a professional "
+    "translator proficient in Persian (Farsi)."
+)
+
+
+def _truncate_for_llm(text: str) -> str:
+    """Bound article text at MAX_SUMMARY_INPUT_TOKENS before prompting.
+
+    Keeps the first 60% and last 40% of the budget so conclusions survive
+    truncation. Uses tiktoken when available, otherwise a rough character
+    bound (~4 chars per token).
+    """
+    if _ENC is None:
+        limit = MAX_SUMMARY_INPUT_TOKENS * 4
+        if len(text) <= limit:
+            return text
+        head = int(limit * 0.6)
+        return text[:head] + "\n…\n" + text[-(limit - head):]
+    toks = _ENC.encode(text)
+    log.debug("Article input: %s tokens", len(toks))
+    if len(toks) <= MAX_SUMMARY_INPUT_TOKENS:
+        return text
+    head = int(MAX_SUMMARY_INPUT_TOKENS * 0.6)
+    tail = MAX_SUMMARY_INPUT_TOKENS - head
+    return _ENC.decode(toks[:head]) + "\n…\n" + _ENC.decode(toks[-tail:])
+
+
+def _insight_user(article_text: str) -> str:
+    return (
         "Summarize the following text in 2–3 formal sentences for a senior business leader "
-        "(clarity, no buzzwords):\n\n" + article_text
+        "(clarity, no buzzwords), then translate that summary into formal Persian (Farsi). "
+        'Return a JSON object {"en": "...", "fa": "..."}.\n\n'
+        + _truncate_for_llm(article_text)
     )
-    return chat_completion(MODEL_SUMMARY, system, user)
 
 
-def translate_persian(summary: str) -> str:
-    system = "You are a professional translator proficient in Persian (Farsi)."
-    user = (
-        "Translate the following English executive summary into formal Persian (Farsi) while keeping the tone professional and concise:\n\n"
-        + summary
+def _parse_insight(item) -> Optional[Tuple[str, str]]:
+    """Validate one {'en': ..., 'fa': ...} object; None if malformed."""
+    if isinstance(item, str):
+        try:
+            item = json.loads(item)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(item, dict):
+        return None
+    en, fa = item.get("en"), item.get("fa")
+    if isinstance(en, str) and en.strip() and isinstance(fa, str) and fa.strip():
+        return en.strip(), fa.strip()
+    return None
+
+
+def summarize_and_translate(article_text: str) -> Tuple[str, str]:
+    """Summarize and translate one article in a single LLM round-trip."""
+    raw = chat_completion(
+        MODEL_SUMMARY,
+        INSIGHT_SYSTEM,
+        _insight_user(article_text),
+        max_tokens=500,
+        json_response=True,
+    )
+    pair = _parse_insight(raw)
+    if pair is None:
+        raise ValueError(f"Malformed en/fa response: {raw[:200]}")
+    return pair
+
+
+async def _summarize_and_translate_async(article_text: str) -> Tuple[str, str]:
+    raw = await chat_completion_async(
+        MODEL_SUMMARY,
+        INSIGHT_SYSTEM,
+        _insight_user(article_text),
+        max_tokens=500,
+        json_response=True,
     )
-    return chat_completion(MODEL_TRANSLATE, system, user)
+    pair = _parse_insight(raw)
+    if pair is None:
+        raise ValueError(f"Malformed en/fa response: {raw[:200]}")
+    return pair
+
+
+def _numbered_batch(texts: List[str]) -> str:
+    """Join texts as '[1]\\n…\\n\\n[2]\\n…' for a single multi-task prompt."""
+    return "\n\n".join(f"[{i}]\n{t}" for i, t in enumerate(texts, 1))
+
+
+def summarize_and_translate_batch(texts: List[str]) -> List[Optional[Tuple[str, str]]]:
+    """Summarize and translate all articles in a single OpenAI round-trip.
+
+    The shared system prompt and TCP round-trip are paid once instead of once
+    per article, and the summary→translation chain no longer costs a second
+    dependent call. The model is asked for `{"items": [...]}` so the response
+    can be validated; indices the batch response misses are retried
+    individually, fanned out with asyncio.gather so the retry costs one
+    latency, not N. Items that still fail come back as None so callers can
+    keep the survivors rather than aborting the whole run.
+    """
+    texts = [_truncate_for_llm(t) for t in texts]
+    results: List[Optional[Tuple[str, str]]] = [None] * len(texts)
+    instruction = (
+        f"For each of the following {len(texts)} articles: summarize it in 2–3 formal "
+        "sentences for a senior business leader (clarity, no buzzwords), then translate "
+        "that summary into formal Persian (Farsi). Return a JSON object "
+        '{"items": [{"en": "...", "fa": "..."}, ...]} with one object per article, in '
+        "input order."
+    )
+    try:
+        raw = chat_completion(
+            MODEL_SUMMARY,
+            INSIGHT_SYSTEM,
+            instruction + "\n\n" + _numbered_batch(texts),
+            max_tokens=2500,
+            json_response=True,
+        )
+        items = json.loads(raw).get("items", [])
+        for i, item in enumerate(items[: len(texts)]):
+            results[i] = _parse_insight(item)
+    except Exception as exc:
+        log.warning("Batch LLM call failed, retrying per item: %s", exc)
+    missing = [i for i in range(len(texts)) if results[i] is None]
+    if missing:
+
+        async def _fill() -> List[object]:
+            return await asyncio.gather(
+                *[_summarize_and_translate_async(texts[i]) for i in missing],
+                return_exceptions=True,
+            )
+
+        for i, pair in zip(missing, asyncio.run(_fill())):
+            if isinstance(pair, BaseException):
+                log.error("LLM failed for item %s: %s", i + 1, pair)
+            else:
+                results[i] = pair  # type: ignore[assignment]
+    return results
 
 
 def build_message(items: List[Tuple[str, str, str]]) -> str:
-    """Assemble final Telegram message string within 4096-char limit."""
-    lines = []
+    """Assemble final Telegram message string within 4096-char limit.
+
+    Truncation happens at item boundaries: a raw character slice could cut an
+    escaped entity (html.escape emits e.g. ``&#x27;``) in half, and Telegram
+    rejects the entire message on a dangling entity with parse_mode=HTML.
+    """
+    buf = io.StringIO()
     for idx, (title, en, fa) in enumerate(items, 1):
-        lines.append(f"📌 Insight #{idx}:")
-        lines.append(f"🗞 Title: {html.escape(title)}")
-        lines.append(f"✍️ English Summary (Formal): {html.escape(en)}")
-        lines.append(f"🈯 Persian Translation (Formal): {html.escape(fa)}")
-        lines.append("\n")  # blank line
-    return "\n".join(lines)[:4000]  # Telegram limit safety
+        start = buf.tell()
+        title_e, en_e, fa_e = html.escape(title), html.escape(en), html.escape(fa)
+        buf.write(
+            f"📌 Insight #{idx}:\n"
+            f"🗞 Title: {title_e}\n"
+            f"✍️ English Summary (Formal): {en_e}\n"
+            f"🈯 Persian Translation (Formal): {fa_e}\n\n\n"
+        )
+        if buf.tell() > 4000:
+            # Drop the item that overflowed and keep the complete ones
+            text = buf.getvalue()[:start]
+            if text:
+                return text
+            # A single oversized item: hard-slice, then trim any split entity
+            text = buf.getvalue()[:4000]
+            amp = text.rfind("&")
+            if amp != -1 and ";" not in text[amp:]:
+                text = text[:amp]
+            return text
+        # Anything past the safety margin would be dropped anyway,
+        # so stop formatting items that cannot appear
+        if buf.tell() > 3800:
+            break
+    return buf.getvalue()
 
 
 def send_telegram(text: str) -> None:
     if not BOT_TOKEN or not CHAT_ID:
         raise RuntimeError("Telegram credentials missing.")
     url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-    resp = requests.post(url, data={"chat_id": CHAT_ID, "text": text})
+    resp = _TG.post(
+        url,
+        json={
+            "chat_id": CHAT_ID,
+            "text": text,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+        },
+        timeout=(5, 10),
+    )
     if not resp.ok:
         raise RuntimeError(f"Telegram error: {resp.text}")
 
@@ -171,27 +577,184 @@ def send_telegram(text: str) -> None:
 # Main flow
 # ---------------------------------------------------------------------------
 
-def run_once() -> None:
-    logging.info("Fetching recent entries…")
+def _collect_articles() -> Tuple[List[str], List[str]]:
+    """Fetch feeds, download pages, and return (titles, full_texts) to process."""
+    log.info("Fetching recent entries…")
     entries = fetch_recent_entries()
-    processed: List[Tuple[str, str, str]] = []
-    for title, link, summary_html, _ in entries:
-        if len(processed) >= MAX_ITEMS:
+    # Download every candidate page up front so waits overlap instead of adding
+    # up; entries whose feed already shipped the body need no download at all
+    html_by_url = download_articles(
+        [link for _, link, _, _, has_full in entries if link and not has_full]
+    )
+    # Article.parse() is CPU-bound lxml work that would serialize under the
+    # GIL, so farm it out across cores
+    parsed: Dict[str, str] = {}
+    if Article:
+        pairs = [(url, doc) for url, doc in html_by_url.items() if doc]
+        if pairs:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pp:
+                parsed = dict(zip([url for url, _ in pairs], pp.map(_parse_html, pairs)))
+    titles: List[str] = []
+    full_texts: List[str] = []
+    for title, link, summary_html, _, has_full in entries:
+        if len(titles) >= MAX_ITEMS:
             break
-        logging.info("Processing: %s", title)
-        full_text = extract_text(link, summary_html)
+        log.debug("Processing: %s", title)
+        titles.append(title)
+        full_texts.append(
+            parsed.get(link) or extract_text(summary_html, has_full_text=has_full)
+        )
+    return titles, full_texts
+
+
+def _cache_conn() -> sqlite3.Connection:
+    """Open the summary cache, creating it and sweeping expired rows."""
+    conn = sqlite3.connect(CACHE_DB)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache(hash TEXT PRIMARY KEY, en TEXT, fa TEXT, ts INTEGER)"
+    )
+    conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - CACHE_TTL_DAYS * 86400,))
+    conn.commit()
+    return conn
+
+
+def run_once() -> None:
+    titles, full_texts = _collect_articles()
+    processed: List[Tuple[str, str, str]] = []
+    if full_texts:
+        # Re-runs (Telegram failure, manual retry) reuse cached results keyed
+        # by content hash instead of re-billing every article
+        conn = _cache_conn()
+        hashes = [hashlib.sha256(text.encode()).hexdigest() for text in full_texts]
+        cached: Dict[str, Tuple[str, str]] = {}
+        for h in hashes:
+            row = conn.execute("SELECT en, fa FROM cache WHERE hash=?", (h,)).fetchone()
+            if row:
+                cached[h] = row
+        misses = [i for i, h in enumerate(hashes) if h not in cached]
         try:
-            en_summary = summarize(full_text)
-            fa_summary = translate_persian(en_summary)
-            processed.append((title, en_summary, fa_summary))
+            if misses:
+                # One fused LLM round-trip for every uncached article; items
+                # that fail come back as None and are simply left out
+                pairs = summarize_and_translate_batch([full_texts[i] for i in misses])
+                now = int(time.time())
+                for i, pair in zip(misses, pairs):
+                    if pair is None:
+                        continue
+                    en, fa = pair
+                    cached[hashes[i]] = (en, fa)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache VALUES (?,?,?,?)", (hashes[i], en, fa, now)
+                    )
+                conn.commit()
+            # Send whatever succeeded; failed articles are dropped, not fatal
+            processed = [
+                (title, *cached[h]) for title, h in zip(titles, hashes) if h in cached
+            ]
         except Exception as exc:
-            logging.error("OpenAI failed for '%s': %s", title, exc)
+            log.error("OpenAI failed: %s", exc)
+        finally:
+            conn.close()
     if not processed:
-        logging.warning("No items processed – aborting send.")
+        log.warning("No items processed – aborting send.")
         return
     message = build_message(processed)
     send_telegram(message)
-    logging.info("Message sent to Telegram (length %s)", len(message))
+    log.info("Message sent to Telegram (length %s)", len(message))
+
+
+def prepare_and_submit() -> None:
+    """Submit the day's insights as an OpenAI batch (50% cost, 24h window).
+
+    Each article is one fused summarize+translate request, so the whole
+    day's LLM work rides in a single batch with no dependent second stage.
+    """
+    titles, full_texts = _collect_articles()
+    if not full_texts:
+        log.warning("No items collected – nothing to submit.")
+        return
+    requests_path = "/tmp/insights_batch_requests.jsonl"
+    with open(requests_path, "w", encoding="utf-8") as fh:
+        for i, text in enumerate(full_texts):
+            fh.write(
+                json.dumps(
+                    {
+                        "custom_id": f"item-{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": MODEL_SUMMARY,
+                            "temperature": 0.3,
+                            "max_tokens": 500,
+                            "response_format": {"type": "json_object"},
+                            "messages": [
+                                {"role": "system", "content": INSIGHT_SYSTEM},
+                                {"role": "user", "content": _insight_user(text)},
+                            ],
+                        },
+                    }
+                )
+                + "\n"
+            )
+    with open(requests_path, "rb") as fh:
+        batch_file = _client().files.create(file=fh, purpose="batch")
+    batch = _client().batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    # Persist what collect_and_send needs: the batch id, the titles, and the
+    # article texts so failed items can be retried synchronously.
+    with open(BATCH_STATE_FILE, "w", encoding="utf-8") as fh:
+        json.dump({"batch_id": batch.id, "titles": titles, "full_texts": full_texts}, fh)
+    log.info("Submitted batch %s with %s articles", batch.id, len(titles))
+
+
+def collect_and_send() -> None:
+    """Collect a previously submitted batch and deliver the message."""
+    try:
+        with open(BATCH_STATE_FILE, encoding="utf-8") as fh:
+            state = json.load(fh)
+    except FileNotFoundError:
+        log.error("No pending batch state at %s – run --submit-batch first.", BATCH_STATE_FILE)
+        return
+    batch = _client().batches.retrieve(state["batch_id"])
+    # Batches usually finish well under the 24h window; give stragglers 20 min
+    for _ in range(20):
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        log.info("Batch %s still %s – waiting…", batch.id, batch.status)
+        time.sleep(60)
+        batch = _client().batches.retrieve(state["batch_id"])
+    titles: List[str] = state["titles"]
+    full_texts: List[str] = state["full_texts"]
+    pairs: List[Optional[Tuple[str, str]]] = [None] * len(titles)
+    if batch.status == "completed" and batch.output_file_id:
+        for line in _client().files.content(batch.output_file_id).text.splitlines():
+            result = json.loads(line)
+            idx = int(result["custom_id"].split("-")[1])
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                body = response["body"]
+                pairs[idx] = _parse_insight(body["choices"][0]["message"]["content"])
+    else:
+        log.warning("Batch %s ended with status %s", batch.id, batch.status)
+    # Retry anything the batch did not return via the synchronous path; a
+    # failed item is dropped rather than aborting the whole delivery
+    for i, pair in enumerate(pairs):
+        if pair is None:
+            try:
+                pairs[i] = summarize_and_translate(full_texts[i])
+            except Exception as exc:
+                log.error("LLM failed for '%s': %s", titles[i], exc)
+    processed = [(t, *pair) for t, pair in zip(titles, pairs) if pair is not None]
+    if not processed:
+        log.warning("No items processed – aborting send.")
+        return
+    message = build_message(processed)
+    send_telegram(message)
+    os.remove(BATCH_STATE_FILE)
+    log.info("Message sent to Telegram (length %s)", len(message))
 
 
 # ---------------------------------------------------------------------------
@@ -201,26 +764,19 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Daily Leadership Insights Bot")
-    parser.add_argument("--run-once", action="store_true", help="Execute immediately instead of schedule")
+    parser.add_argument("--run-once", action="store_true", help="Execute one run immediately (the default)")
+    parser.add_argument("--submit-batch", action="store_true", help="Submit summaries via the OpenAI Batch API (50%% cost)")
+    parser.add_argument("--collect-batch", action="store_true", help="Collect a submitted batch and send to Telegram")
     args = parser.parse_args()
 
-    if args.run_once:
-        run_once()
+    if args.submit_batch:
+        prepare_and_submit()
+    elif args.collect_batch:
+        collect_and_send()
     else:
-        # Run now and then sleep until next 09:30 Asia/Tehran
-        tz_tehran = pytz.timezone("Asia/Tehran")
-        while True:
-            now_utc = datetime.now(timezone.utc)
-            now_teh = now_utc.astimezone(tz_tehran)
-            target = now_teh.replace(hour=9, minute=30, second=0, microsecond=0)
-            if now_teh >= target:
-                target += timedelta(days=1)
-            sleep_seconds = (target - now_teh).total_seconds()
-            logging.info("Sleeping %.1f h until next run at %s Tehran", sleep_seconds / 3600, target)
-            import time
-
-            time.sleep(sleep_seconds)
-            run_once()
+        # Scheduling is the cron's job (see module docstring); the script
+        # itself always does a single run and exits
+        run_once()
 
 # ---------------------------------------------------------------------------
 # requirements.txt (place in separate file when deploying)
@@ -228,8 +784,10 @@ if __name__ == "__main__":
 # feedparser
 # openai>=1.13.3
 # requests
+# aiohttp
+# httpx
+# tenacity
+# tiktoken  # optional, exact token truncation
 # python-dateutil
-# pytz
 # python-telegram-bot==20.8  # optional, we use raw requests so not strictly needed
 # newspaper3k==0.2.8  # optional but recommended
-# schedule==1.2.1  # only if you prefer schedule library instead of manual sleep